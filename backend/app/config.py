@@ -3,8 +3,10 @@ from __future__ import annotations
 import os
 from functools import lru_cache
 from pathlib import Path
+from typing import Annotated
 
-from pydantic import BaseModel, Field
+from pydantic import Field, field_validator
+from pydantic_settings import BaseSettings, NoDecode, SettingsConfigDict
 
 
 def _ensure_openai_key_from_file() -> None:
@@ -23,58 +25,65 @@ def _ensure_openai_key_from_file() -> None:
         pass
 
 
-_ensure_openai_key_from_file()
-
-
-class Settings(BaseModel):
-    database_url: str = Field(
-        default=os.getenv("DATABASE_URL", "sqlite:///./data/ev_charging.db")
-    )
-    business_timezone: str = Field(
-        default=os.getenv("BUSINESS_TIMEZONE", "Asia/Seoul")
-    )
-    admin_email: str = Field(default=os.getenv("ADMIN_EMAIL", "admin@demo.dev"))
-    admin_password: str = Field(default=os.getenv("ADMIN_PASSWORD", "admin123"))
-    admin_token: str = Field(default=os.getenv("ADMIN_TOKEN", "admin-demo-token"))
-    auto_seed_sessions: bool = Field(
-        default=os.getenv("AUTO_SEED_SESSIONS", "0").lower()
-        in {"1", "true", "yes", "on"}
-    )
-    cors_origins: list[str] = Field(
-        default_factory=lambda: [
-            origin.strip()
-            for origin in os.getenv("CORS_ORIGINS", "").split(",")
-            if origin.strip()
-        ]
+class Settings(BaseSettings):
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        env_file_encoding="utf-8",
+        env_ignore_empty=True,
+        extra="ignore",
+        populate_by_name=True,
     )
+
+    database_url: str = "sqlite:///./data/ev_charging.db"
+    business_timezone: str = "Asia/Seoul"
+    admin_email: str = "admin@demo.dev"
+    admin_password: str = "admin123"
+    admin_token: str = "admin-demo-token"
+    auto_seed_sessions: bool = False
+    # Raise on lazy relationship loads in read queries so N+1 access patterns
+    # surface as errors during development and tests.
+    strict_loading: bool = False
+    # Comma-separated in the environment (CORS_ORIGINS=http://a,http://b).
+    cors_origins: Annotated[list[str], NoDecode] = Field(default_factory=list)
     # Plate recognition mode:
     # - gptapi : call OpenAI Responses API directly
     # - http   : forward the uploaded image to an external HTTP endpoint
-    plate_service_mode: str = Field(
-        default=os.getenv("PLATE_SERVICE_MODE", "gptapi").lower()
-    )
+    plate_service_mode: str = "gptapi"
     plate_service_endpoint: str = Field(
-        default=os.getenv(
-            "PLATE_SERVICE_URL", "http://localhost:8001/v1/recognize"
-        )
-    )
-    plate_openai_model: str = Field(
-        default=os.getenv("PLATE_OPENAI_MODEL", "gpt-5-mini")
+        default="http://localhost:8001/v1/recognize",
+        validation_alias="PLATE_SERVICE_URL",
     )
-    plate_openai_prompt: str = Field(
-        default=os.getenv(
-            "PLATE_OPENAI_PROMPT",
-            (
-                "Read only the license plate number from the image. "
-                "Return just the plate text; keep any hyphen or dash characters."
-                "번호판은 한국 번호판입니다. 숫자와 한글만 포함되어있읍니다 "
-                "출력은 번호판 텍스트만 한 줄로 적으세요. 앞뒤에 따옴표, 괄호, 대시(-), 공백, 설명을 추가하지 마세요. 번호판에 실제로 포함된 문자만 그대로 적고 다른 것은 아무것도 쓰지 마세요."
-            ),
-        )
+    plate_openai_model: str = "gpt-5-mini"
+    plate_openai_prompt: str = (
+        "Read only the license plate number from the image. "
+        "Return just the plate text; keep any hyphen or dash characters."
+        "번호판은 한국 번호판입니다. 숫자와 한글만 포함되어있읍니다 "
+        "출력은 번호판 텍스트만 한 줄로 적으세요. 앞뒤에 따옴표, 괄호, 대시(-), 공백, 설명을 추가하지 마세요. 번호판에 실제로 포함된 문자만 그대로 적고 다른 것은 아무것도 쓰지 마세요."
     )
-    openai_api_key: str = Field(default=os.getenv("OPENAI_API_KEY", ""))
+    openai_api_key: str = ""
+
+    @field_validator("auto_seed_sessions", "strict_loading", mode="before")
+    @classmethod
+    def _parse_flag(cls, value: object) -> object:
+        # Any unrecognised string means "off" rather than a validation error.
+        if isinstance(value, str):
+            return value.strip().lower() in {"1", "true", "yes", "on"}
+        return value
+
+    @field_validator("cors_origins", mode="before")
+    @classmethod
+    def _split_cors_origins(cls, value: object) -> object:
+        if isinstance(value, str):
+            return [origin.strip() for origin in value.split(",") if origin.strip()]
+        return value
+
+    @field_validator("plate_service_mode")
+    @classmethod
+    def _lower_plate_service_mode(cls, value: str) -> str:
+        return value.lower()
 
 
 @lru_cache(1)
 def get_settings() -> Settings:
+    _ensure_openai_key_from_file()
     return Settings()
@@ -2,12 +2,14 @@ from __future__ import annotations
 
 import logging
 from datetime import date, datetime, timedelta
+from functools import lru_cache
 from typing import Iterable, Optional
 
-from sqlalchemy import and_, func, select
+from sqlalchemy import Select, and_, exists, func, insert, select, update
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy.orm import Session, selectinload
+from sqlalchemy.orm import Session, raiseload, selectinload
 
+from .config import get_settings
 from .models import ChargingSession, Reservation, ReservationSlot, ReservationStatus
 from .time_utils import (
     UTC,
@@ -17,7 +19,9 @@ from .time_utils import (
 )
 
 SLOT_INTERVAL_MINUTES = 30
+MIGRATION_BATCH_SIZE = 500
 OVERLAP_ERROR_MESSAGE = "해당 시간대 이미 예약이 존재합니다."
+PLATE_CONFLICT_ERROR_MESSAGE = "해당 차량은 다른 시간대에 이미 예약되어 있습니다."
 
 
 def _lock_session(session: Session, *, session_id: int) -> None:
@@ -25,27 +29,61 @@ def _lock_session(session: Session, *, session_id: int) -> None:
     Acquire a row-level lock for the target charging session so that concurrent
     reservations on the same session serialize properly.
     """
-    stmt = (
-        select(ChargingSession.id)
-        .where(ChargingSession.id == session_id)
-        .with_for_update()
-    )
-    session.scalars(stmt).first()
+    if _supports_row_locks(session):
+        session.get(ChargingSession, session_id, with_for_update=True)
+
+
+def _supports_row_locks(session: Session) -> bool:
+    """
+    SQLite ignores FOR UPDATE and already serializes writers with its
+    database-level lock, so row locks are only requested on other dialects.
+    """
+    return session.get_bind().dialect.name != "sqlite"
+
+
+def _maybe_for_update(session: Session, stmt: Select) -> Select:
+    return stmt.with_for_update() if _supports_row_locks(session) else stmt
+
+
+def _reservation_read_options() -> list:
+    """Loader options for read-only reservation queries.
+
+    Callers only read column attributes, so no relationship is eager-loaded;
+    with ``strict_loading`` enabled any relationship access raises instead of
+    issuing a lazy load.
+    """
+    if get_settings().strict_loading:
+        return [raiseload("*")]
+    return []
 
 
+@lru_cache(maxsize=4096)
 def normalize_plate(plate: str) -> str:
     return "".join(plate.split()).upper()
 
 
+def normalize_email(email: str | None) -> str | None:
+    return email.strip().lower() if email else None
+
+
 def ensure_base_sessions(session: Session, *, names: Iterable[str]) -> None:
     names_tuple = tuple(names)
-    existing_count = session.scalar(select(func.count()).select_from(ChargingSession))
-    if existing_count and existing_count >= len(names_tuple):
+    existing = set(
+        session.scalars(
+            select(ChargingSession.id).where(
+                ChargingSession.id.in_(range(1, len(names_tuple) + 1))
+            )
+        ).all()
+    )
+    missing = [
+        {"id": idx, "name": name}
+        for idx, name in enumerate(names_tuple, start=1)
+        if idx not in existing
+    ]
+    if not missing:
         return
 
-    for idx, name in enumerate(names_tuple, start=1):
-        if session.get(ChargingSession, idx) is None:
-            session.add(ChargingSession(id=idx, name=name))
+    session.execute(insert(ChargingSession), missing)
     session.commit()
 
 
@@ -58,6 +96,7 @@ def reservations_by_date(session: Session, *, date_value: date) -> list[Reservat
     stmt = (
         select(Reservation)
         .where(and_(Reservation.start_time >= start, Reservation.start_time < end))
+        .options(*_reservation_read_options())
         .order_by(Reservation.start_time)
     )
     return session.scalars(stmt).all()
@@ -76,6 +115,7 @@ def reservations_by_session_and_date(
                 Reservation.start_time < end,
             )
         )
+        .options(*_reservation_read_options())
         .order_by(Reservation.start_time)
     )
     return session.scalars(stmt).all()
@@ -90,9 +130,6 @@ def create_reservation(
     end_time: datetime,
     contact_email: str | None = None,
 ) -> Reservation:
-    # Prevent concurrent reservation creation on the same session.
-    _lock_session(session, session_id=session_id)
-
     start_time_utc = ensure_utc(start_time)
     end_time_utc = ensure_utc(end_time)
     if start_time_utc is None or end_time_utc is None:
@@ -101,9 +138,29 @@ def create_reservation(
         raise ValueError("종료 시간이 시작 시간 이후여야 합니다.")
 
     normalized_plate = normalize_plate(plate)
-    ensure_no_overlap(session, session_id=session_id, start=start_time_utc, end=end_time_utc)
+    normalized_email = normalize_email(contact_email)
+    # Reject an obvious plate conflict before waiting on the session lock; the
+    # locking check below re-verifies it once the lock is held. Without row
+    # locks (SQLite) there is nothing to wait on, so only that check runs.
+    if _supports_row_locks(session) and _has_plate_conflict(
+        session,
+        plate=normalized_plate,
+        session_id=session_id,
+        start=start_time_utc,
+        end=end_time_utc,
+    ):
+        raise ValueError(PLATE_CONFLICT_ERROR_MESSAGE)
+
+    # Prevent concurrent reservation creation on the same session.
+    _lock_session(session, session_id=session_id)
+
+    # Slot overlap is not pre-checked: uq_session_slot rejects it on insert below.
     ensure_no_conflict_for_plate(
-        session, plate=normalized_plate, start=start_time_utc, end=end_time_utc
+        session,
+        plate=normalized_plate,
+        session_id=session_id,
+        start=start_time_utc,
+        end=end_time_utc,
     )
 
     slot_starts = _generate_slot_starts(start_time_utc, end_time_utc)
@@ -117,25 +174,34 @@ def create_reservation(
         start_time=start_time_utc,
         end_time=end_time_utc,
         status=ReservationStatus.CONFIRMED,
-        contact_email=(contact_email.strip().lower() if contact_email else None),
+        contact_email=normalized_email,
     )
-    reservation.slots = [
-        ReservationSlot(session_id=session_id, slot_start=slot_start) for slot_start in slot_starts
-    ]
     session.add(reservation)
     try:
         session.flush()
+        # Insert every slot in one executemany batch instead of one INSERT per
+        # ORM object; the unique constraint on (session_id, slot_start) still
+        # guards against races.
+        session.execute(
+            ReservationSlot.__table__.insert(),
+            [
+                {
+                    "session_id": session_id,
+                    "reservation_id": reservation.id,
+                    "slot_start": slot_start,
+                }
+                for slot_start in slot_starts
+            ],
+        )
         normalized_start = ensure_utc(reservation.start_time)
         normalized_end = ensure_utc(reservation.end_time)
         if normalized_start is not None:
             reservation.start_time = normalized_start
         if normalized_end is not None:
             reservation.end_time = normalized_end
-        for slot in reservation.slots:
-            normalized_slot = ensure_utc(slot.slot_start)
-            if normalized_slot is not None:
-                slot.slot_start = normalized_slot
     except IntegrityError as exc:
+        # Plate conflicts are checked above and have no unique constraint, so
+        # any violation here is uq_session_slot / uq_reservation_session_start.
         session.rollback()
         raise ValueError(OVERLAP_ERROR_MESSAGE) from exc
     return reservation
@@ -148,51 +214,76 @@ def ensure_no_overlap(
     start: datetime,
     end: datetime,
 ) -> None:
+    """
+    Raise if any slot between start and end is already booked on the session.
+
+    create_reservation relies on uq_session_slot instead; this stays public for
+    callers that want to check availability without inserting.
+    """
     start_utc = ensure_utc(start)
     end_utc = ensure_utc(end)
     slot_starts = _generate_slot_starts(start_utc, end_utc)
     if not slot_starts:
         return
 
-    overlap_stmt = (
-        select(ReservationSlot.slot_start)
-        .where(
+    overlap_stmt = select(
+        exists().where(
             and_(
                 ReservationSlot.session_id == session_id,
                 ReservationSlot.slot_start.in_(slot_starts),
             )
         )
-        .limit(1)
     )
-    conflict = session.scalars(overlap_stmt).first()
-    if conflict:
+    if session.scalar(overlap_stmt):
         raise ValueError(OVERLAP_ERROR_MESSAGE)
 
+
+def _plate_conflict_condition(
+    plate: str, session_id: int, start_utc: datetime, end_utc: datetime
+):
+    # Same-session overlaps share a 30-minute slot, so uq_session_slot rejects
+    # them with the overlap message; only other sessions count here.
+    return and_(
+        Reservation.plate_normalized == plate,
+        Reservation.session_id != session_id,
+        Reservation.status != ReservationStatus.CANCELLED,
+        Reservation.start_time < end_utc,
+        Reservation.end_time > start_utc,
+    )
+
+
+def _has_plate_conflict(
+    session: Session,
+    *,
+    plate: str,
+    session_id: int,
+    start: datetime,
+    end: datetime,
+) -> bool:
+    """Non-locking EXISTS check for an overlapping reservation of the plate."""
+    condition = _plate_conflict_condition(
+        plate, session_id, ensure_utc(start), ensure_utc(end)
+    )
+    return bool(session.scalar(select(exists().where(condition))))
+
+
 def ensure_no_conflict_for_plate(
     session: Session,
     *,
     plate: str,
+    session_id: int,
     start: datetime,
     end: datetime,
 ) -> None:
     start_utc = ensure_utc(start)
     end_utc = ensure_utc(end)
 
-    stmt = (
-        select(Reservation)
-        .where(
-            and_(
-                Reservation.plate_normalized == plate,
-                Reservation.status != ReservationStatus.CANCELLED,
-                Reservation.start_time < end_utc,
-                Reservation.end_time > start_utc,
-            )
-        )
-        .with_for_update()
+    stmt = select(Reservation).where(
+        _plate_conflict_condition(plate, session_id, start_utc, end_utc)
     )
-    conflict = session.scalars(stmt).first()
+    conflict = session.scalars(_maybe_for_update(session, stmt)).first()
     if conflict:
-        raise ValueError("해당 차량은 다른 시간대에 이미 예약되어 있습니다.")
+        raise ValueError(PLATE_CONFLICT_ERROR_MESSAGE)
 
 
 def find_conflicting_plate_reservation(
@@ -203,7 +294,11 @@ def find_conflicting_plate_reservation(
     end: Optional[datetime],
 ) -> Optional[Reservation]:
     normalized_plate = normalize_plate(plate)
-    stmt = select(Reservation).where(Reservation.plate_normalized == normalized_plate)
+    stmt = (
+        select(Reservation)
+        .where(Reservation.plate_normalized == normalized_plate)
+        .options(*_reservation_read_options())
+    )
     if start and end:
         start_utc = ensure_utc(start)
         end_utc = ensure_utc(end)
@@ -214,7 +309,7 @@ def find_conflicting_plate_reservation(
                 Reservation.end_time > start_utc,
             )
         )
-    stmt = stmt.order_by(Reservation.start_time.desc())
+    stmt = stmt.order_by(Reservation.start_time.desc()).limit(1)
     return session.scalars(stmt).first()
 
 
@@ -239,7 +334,9 @@ def find_active_reservation_by_plate(
                 Reservation.end_time > moment,
             )
         )
+        .options(*_reservation_read_options())
         .order_by(Reservation.start_time.asc())
+        .limit(1)
     )
     return session.scalars(stmt).first()
 
@@ -261,10 +358,14 @@ def reservations_for_user(
     if not email and not plate:
         raise ValueError("email 또는 plate 중 하나는 반드시 제공해야 합니다.")
 
-    stmt = select(Reservation).order_by(Reservation.start_time.desc())
+    stmt = (
+        select(Reservation)
+        .options(*_reservation_read_options())
+        .order_by(Reservation.start_time.desc())
+    )
     conditions = []
     if email:
-        conditions.append(func.lower(Reservation.contact_email) == email.lower())
+        conditions.append(Reservation.contact_email == normalize_email(email))
     if plate:
         conditions.append(Reservation.plate_normalized == normalize_plate(plate))
     if conditions:
@@ -284,7 +385,7 @@ def delete_reservation_for_user(
 
     stmt = select(Reservation).where(Reservation.id == reservation_id)
     if email:
-        stmt = stmt.where(func.lower(Reservation.contact_email) == email.lower())
+        stmt = stmt.where(Reservation.contact_email == normalize_email(email))
     if plate:
         stmt = stmt.where(Reservation.plate_normalized == normalize_plate(plate))
 
@@ -298,39 +399,64 @@ def delete_reservation_for_user(
 def migrate_reservation_times_to_utc(session: Session) -> None:
     """Backfill existing reservations and slots to UTC if stored without tzinfo."""
     logger = logging.getLogger(__name__)
+    if session.get_bind().dialect.name == "postgresql":
+        # timestamptz columns never come back naive, so there is nothing to fix.
+        return
+
     zone = business_timezone()
     reservations = session.scalars(
-        select(Reservation).options(selectinload(Reservation.slots))
-    ).all()
+        select(Reservation)
+        .options(selectinload(Reservation.slots))
+        .execution_options(yield_per=MIGRATION_BATCH_SIZE)
+    )
 
     updated = False
-    for reservation in reservations:
-        if reservation.start_time and reservation.start_time.tzinfo is None:
-            reservation.start_time = reservation.start_time.replace(tzinfo=zone).astimezone(UTC)
-            updated = True
-        if reservation.end_time and reservation.end_time.tzinfo is None:
-            reservation.end_time = reservation.end_time.replace(tzinfo=zone).astimezone(UTC)
-            updated = True
-        if reservation.created_at and reservation.created_at.tzinfo is None:
-            reservation.created_at = reservation.created_at.replace(tzinfo=zone).astimezone(UTC)
-            updated = True
-        if reservation.updated_at and reservation.updated_at.tzinfo is None:
-            reservation.updated_at = reservation.updated_at.replace(tzinfo=zone).astimezone(UTC)
-            updated = True
-
-        for slot in reservation.slots:
-            if slot.slot_start and slot.slot_start.tzinfo is None:
-                slot.slot_start = slot.slot_start.replace(tzinfo=zone).astimezone(UTC)
+    try:
+        for idx, reservation in enumerate(reservations, start=1):
+            if reservation.start_time and reservation.start_time.tzinfo is None:
+                reservation.start_time = reservation.start_time.replace(tzinfo=zone).astimezone(UTC)
+                updated = True
+            if reservation.end_time and reservation.end_time.tzinfo is None:
+                reservation.end_time = reservation.end_time.replace(tzinfo=zone).astimezone(UTC)
+                updated = True
+            if reservation.created_at and reservation.created_at.tzinfo is None:
+                reservation.created_at = reservation.created_at.replace(tzinfo=zone).astimezone(UTC)
+                updated = True
+            if reservation.updated_at and reservation.updated_at.tzinfo is None:
+                reservation.updated_at = reservation.updated_at.replace(tzinfo=zone).astimezone(UTC)
                 updated = True
 
-    if updated:
-        try:
+            for slot in reservation.slots:
+                if slot.slot_start and slot.slot_start.tzinfo is None:
+                    slot.slot_start = slot.slot_start.replace(tzinfo=zone).astimezone(UTC)
+                    updated = True
+
+            if updated and idx % MIGRATION_BATCH_SIZE == 0:
+                session.flush()
+
+        if updated:
             session.flush()
-        except IntegrityError as exc:  # pragma: no cover - defensive
-            session.rollback()
-            logger.warning(
-                "Skipping UTC migration due to unique constraint conflict: %s", exc
+    except IntegrityError as exc:  # pragma: no cover - defensive
+        session.rollback()
+        logger.warning(
+            "Skipping UTC migration due to unique constraint conflict: %s", exc
+        )
+
+
+def normalize_contact_emails(session: Session) -> None:
+    """Lowercase and trim contact emails stored before they were normalized on write."""
+    normalized = func.lower(func.trim(Reservation.contact_email))
+    session.execute(
+        update(Reservation)
+        .where(
+            and_(
+                Reservation.contact_email.is_not(None),
+                Reservation.contact_email != normalized,
             )
+        )
+        .values(contact_email=normalized)
+        .execution_options(synchronize_session=False)
+    )
 
 
 def ensure_reservation_slots(session: Session) -> None:
@@ -338,10 +464,16 @@ def ensure_reservation_slots(session: Session) -> None:
         select(Reservation)
         .where(Reservation.status != ReservationStatus.CANCELLED)
         .options(selectinload(Reservation.slots))
-    ).all()
+        .execution_options(stream_results=True, yield_per=MIGRATION_BATCH_SIZE)
+    )
 
     updated = False
-    for reservation in reservations:
+    pending_slots: list[dict] = []
+    for idx, reservation in enumerate(reservations, start=1):
+        if idx % MIGRATION_BATCH_SIZE == 0:
+            _flush_reservation_slots(session, pending_slots, updated)
+            updated = False
+
         start_utc = ensure_utc(reservation.start_time)
         end_utc = ensure_utc(reservation.end_time)
         if start_utc is None or end_utc is None:
@@ -368,34 +500,39 @@ def ensure_reservation_slots(session: Session) -> None:
                 updated = True
             existing.add(normalized_slot)
 
-        missing = [slot_start for slot_start in slot_starts if slot_start not in existing]
-        if not missing:
-            continue
-
-        reservation.slots.extend(
-            ReservationSlot(session_id=reservation.session_id, slot_start=slot_start)
-            for slot_start in missing
+        pending_slots.extend(
+            {
+                "session_id": reservation.session_id,
+                "reservation_id": reservation.id,
+                "slot_start": slot_start,
+            }
+            for slot_start in slot_starts
+            if slot_start not in existing
         )
-        updated = True
 
+    _flush_reservation_slots(session, pending_slots, updated)
+
+
+def _flush_reservation_slots(session: Session, pending_slots: list[dict], updated: bool) -> None:
+    """Flush ORM changes, then bulk-insert and clear the pending slot rows."""
     if updated:
         session.flush()
+    if pending_slots:
+        session.execute(ReservationSlot.__table__.insert(), pending_slots)
+        pending_slots.clear()
 
 
 def _generate_slot_starts(start: datetime, end: datetime) -> list[datetime]:
-    """Return slot start datetimes between start (inclusive) and end (exclusive)."""
-    if start is None or end is None:
-        return []
+    """Return slot start datetimes between start (inclusive) and end (exclusive).
 
-    start_utc = ensure_utc(start)
-    end_utc = ensure_utc(end)
-    if start_utc is None or end_utc is None or end_utc <= start_utc:
+    Callers pass UTC-aware datetimes (already run through ``ensure_utc``).
+    """
+    if start is None or end is None:
         return []
 
-    slots: list[datetime] = []
-    current = start_utc
     delta = timedelta(minutes=SLOT_INTERVAL_MINUTES)
-    while current < end_utc:
-        slots.append(current)
-        current += delta
-    return slots
+    # Ceiling division so a trailing partial interval still gets a slot.
+    count = -(-(end - start) // delta)
+    if count <= 0:
+        return []
+    return [start + delta * idx for idx in range(count)]
@@ -51,8 +51,22 @@ def create_app() -> FastAPI:
                 connection.execute(
                     text("ALTER TABLE reservations ADD COLUMN contact_email VARCHAR(255)")
                 )
+            # create_all() does not add new indexes to tables that already exist.
+            for index in models.Reservation.__table__.indexes:
+                index.create(connection, checkfirst=True)
+            # Indexes no longer declared on the models: the plate and slot ones are
+            # covered by ix_reservation_plate_start and uq_session_slot, the last
+            # one belonged to the retired contact_email_normalized column.
+            for index_name in (
+                "ix_reservations_plate_normalized",
+                "ix_res_active_plate",
+                "ix_reservation_slots_session_id",
+                "ix_reservations_contact_email_normalized",
+            ):
+                connection.execute(text(f"DROP INDEX IF EXISTS {index_name}"))
         with SessionLocal() as session:
             crud.migrate_reservation_times_to_utc(session)
+            crud.normalize_contact_emails(session)
             crud.ensure_reservation_slots(session)
             session.commit()
         if settings.auto_seed_sessions:
@@ -9,6 +9,7 @@ from sqlalchemy import (
     DateTime,
     Enum as SAEnum,
     ForeignKey,
+    Index,
     Integer,
     String,
     UniqueConstraint,
@@ -47,7 +48,7 @@ class Reservation(Base):
     id = Column(String(36), primary_key=True, default=lambda: str(uuid4()))
     session_id = Column(Integer, ForeignKey("charging_sessions.id"), nullable=False, index=True)
     plate = Column(String(32), nullable=False, index=True)
-    plate_normalized = Column(String(32), nullable=False, index=True)
+    plate_normalized = Column(String(32), nullable=False)
     start_time = Column(DateTime(timezone=True), nullable=False, index=True)
     end_time = Column(DateTime(timezone=True), nullable=False, index=True)
     status = Column(SAEnum(ReservationStatus, name="reservation_status"), nullable=False, default=ReservationStatus.CONFIRMED)
@@ -89,8 +90,20 @@ class Reservation(Base):
         return ReservationStatus.COMPLETED
 
 
+# Serves "latest reservation for this plate" lookups straight from the index
+# and, scanned forward, the active-reservation range lookups by plate; it also
+# covers plain plate_normalized filters via its leading column.
+Index(
+    "ix_reservation_plate_start",
+    Reservation.plate_normalized,
+    Reservation.start_time.desc(),
+)
+
+
 class ReservationSlot(Base):
     __tablename__ = "reservation_slots"
+    # The unique constraint doubles as the composite (session_id, slot_start)
+    # index used by the overlap check, so session_id needs no index of its own.
     __table_args__ = (UniqueConstraint("session_id", "slot_start", name="uq_session_slot"),)
 
     id = Column(Integer, primary_key=True, autoincrement=True)
@@ -100,7 +113,7 @@ class ReservationSlot(Base):
         nullable=False,
         index=True,
     )
-    session_id = Column(Integer, ForeignKey("charging_sessions.id"), nullable=False, index=True)
+    session_id = Column(Integer, ForeignKey("charging_sessions.id"), nullable=False)
     slot_start = Column(DateTime(timezone=True), nullable=False, index=True)
 
     reservation = relationship("Reservation", back_populates="slots")
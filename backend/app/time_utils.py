@@ -23,8 +23,12 @@ def combine_business_datetime(date_value: date, time_value: time) -> datetime:
     return naive_dt.replace(tzinfo=business_timezone())
 
 
+@lru_cache(maxsize=512)
 def business_day_bounds_utc(date_value: date) -> Tuple[datetime, datetime]:
-    """Return the UTC start (inclusive) and end (exclusive) datetimes for the business day."""
+    """Return the UTC start (inclusive) and end (exclusive) datetimes for the business day.
+
+    Cached per date; the business timezone is itself fixed for the process.
+    """
     start_local = combine_business_datetime(date_value, time.min)
     end_local = start_local + timedelta(days=1)
     return start_local.astimezone(UTC), end_local.astimezone(UTC)